@@ -9,137 +9,280 @@ import sys
 import json
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
+# Box-drawing characters that make up tree indentation
+_TREE_CHARS = '│├└─'
+
+# Patterns used to split a structure line into its indent and item parts
+_TREE_RE = re.compile(rf'^([{_TREE_CHARS}\s]*)([^{_TREE_CHARS}].*)$')
+_INDENT_RE = re.compile(r'^(\s*)(.*)$')
+
+# Translation table that strips tree characters from an indent prefix
+_TREE_TBL = str.maketrans('', '', _TREE_CHARS)
+
+# Flags for creating a new file, failing if it already exists
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+# Smallest number of files worth spreading across a thread pool
+_PARALLEL_MIN_FILES = 32
+
+# Example settings written into generated settings.json files
+DEFAULT_SETTINGS = {
+    "timer_intervals": {
+        "focus": 30,
+        "short_break": 5,
+        "long_break": 15
+    },
+    "growth_stages": {
+        "seed": {"minutes": 0, "image": "seed.png"},
+        "sprout": {"minutes": 30, "image": "sprout.png"},
+        "plant": {"minutes": 60, "image": "plant.png"},
+        "flower": {"minutes": 90, "image": "flower.png"}
+    }
+}
+
+# Starter content for known file names, serialized once at import
+_DEFAULT_CONTENT = {
+    '__init__.py': b'"""Package initialization."""\n',
+    'settings.json': json.dumps(DEFAULT_SETTINGS, indent=4).encode('utf-8'),
+    'requirements.txt': b'# Dependencies\nPillow>=9.0.0\n',
+    '.gitignore': (
+        b'# Python\n__pycache__/\n*.py[cod]\n*.so\n.Python\n\n'
+        b'# Environment\n.env\n.venv\nenv/\nvenv/\n\n'
+        b'# IDE\n.vscode/\n.idea/\n*.swp\n*.swo\n*~\n\n'
+        b'# OS\n.DS_Store\nThumbs.db\n'
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _indent_depth(indent_part):
+    """
+    Return the nesting depth of an indent prefix.
+    Each tree character counts as one level and every two spaces as another;
+    prefixes repeat heavily in a structure file, so results are cached.
+    """
+    spaces = indent_part.translate(_TREE_TBL)
+    depth = len(indent_part) - len(spaces)
+    return depth + len(spaces) // 2
+
+
 def parse_structure_file(filepath):
     """
     Parse a text file containing a tree-like structure.
     Returns a list of paths to create.
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
     paths = []
     current_path = []
 
-    for line in lines:
-        # Skip empty lines and separators
-        line = line.rstrip()
-        if not line or set(line) == {'-', ' '} or line.startswith('```'):
-            continue
+    # Bind hot-loop lookups to locals once
+    tree_match = _TREE_RE.match
+    indent_match_plain = _INDENT_RE.match
+    add_path = paths.append
 
-        # Determine indentation level (count leading spaces or tree characters)
-        indent_match = re.match(r'^([│├└─\s]*)([^│├└─].*)$', line)
-        if indent_match:
-            indent_part = indent_match.group(1)
-            item = indent_match.group(2).strip()
-        else:
-            # Handle lines without tree characters
-            indent_match = re.match(r'^(\s*)(.*)$', line)
-            if indent_match:
-                indent_part = indent_match.group(1)
-                item = indent_match.group(2).strip()
-            else:
+    # Stream lines rather than reading the whole file into memory
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            # Skip empty lines and separators
+            line = line.rstrip()
+            if not line or not line.lstrip(' -') or line.startswith('```'):
                 continue
 
-        # Calculate depth based on indentation
-        # Count tree characters and spaces
-        depth = indent_part.count('│') + indent_part.count('├') + indent_part.count('└') + indent_part.count('─')
-        depth += len(indent_part.replace('│', '').replace('├', '').replace('└', '').replace('─', '')) // 2
+            # Determine indentation level (count leading spaces or tree characters)
+            indent_match = tree_match(line)
+            if not indent_match:
+                # Handle lines without tree characters
+                indent_match = indent_match_plain(line)
+                if not indent_match:
+                    continue
+            indent_part, item = indent_match.groups()
 
-        # Adjust path based on depth
-        while len(current_path) > depth:
-            current_path.pop()
+            # Calculate depth based on indentation
+            depth = _indent_depth(indent_part)
 
-        # Clean up the item name (remove trailing comments, etc.)
-        item = item.split('#')[0].strip()
-        if not item:
-            continue
+            # Adjust path based on depth
+            del current_path[depth:]
 
-        # Handle directories (end with /) and files
-        if item.endswith('/'):
-            current_path.append(item[:-1])
-            paths.append(('/'.join(current_path), 'dir'))
-        else:
-            # It's a file
-            file_path = '/'.join(current_path + [item])
-            paths.append((file_path, 'file'))
+            # Clean up the item name (remove trailing comments, etc.)
+            item = item.partition('#')[0].strip()
+            if not item:
+                continue
+
+            # Handle directories (end with /) and files
+            if item.endswith('/'):
+                current_path.append(item[:-1])
+                add_path(('/'.join(current_path), 'dir'))
+            else:
+                # It's a file
+                file_path = '/'.join(current_path + [item])
+                add_path((file_path, 'file'))
 
     return paths
 
 
-def create_structure(paths, base_dir=None):
+def _parent_dirs(path):
+    """Yield every ancestor of a relative path, deepest first."""
+    parent = os.path.dirname(path)
+    while parent:
+        yield parent
+        parent = os.path.dirname(parent)
+
+
+def _file_dir_conflicts(paths):
+    """Return the file entries whose path is also used as a directory."""
+    files = {path for path, item_type in paths if item_type == 'file'}
+    if not files:
+        return set()
+
+    dirs = set()
+    for path, item_type in paths:
+        directory = path if item_type == 'dir' else os.path.dirname(path)
+        while directory and directory not in dirs:
+            dirs.add(directory)
+            directory = os.path.dirname(directory)
+
+    return files & dirs
+
+
+def _leaf_dirs(paths):
+    """
+    Return the deepest directories implied by parsed paths, shortest first.
+    Creating these with makedirs creates every other directory too.
+    """
+    dirs = {path for path, item_type in paths if item_type == 'dir'}
+    dirs.update(os.path.dirname(path) for path, item_type in paths if item_type == 'file')
+    dirs.discard('')
+
+    ancestors = set()
+    for directory in dirs:
+        for parent in _parent_dirs(directory):
+            if parent in ancestors:
+                break
+            ancestors.add(parent)
+
+    return sorted(dirs - ancestors, key=len)
+
+
+def _create_file(full_path, payload, ensured):
+    """
+    Create a single file with optional starter content.
+    Existing files are left untouched. `ensured` is the set of directories
+    already known to exist; the file's parent is created and added if missing.
+    """
+    # Worker threads share `ensured`; a race only repeats a harmless makedirs
+    parent = os.path.dirname(full_path)
+    if parent not in ensured:
+        os.makedirs(parent, exist_ok=True)
+        ensured.add(parent)
+
+    try:
+        fd = os.open(full_path, _CREATE_FLAGS, 0o666)
+    except FileExistsError:
+        return
+    try:
+        if payload:
+            os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _try_create_file(job):
+    """Run _create_file, returning the exception instead of raising it."""
+    try:
+        _create_file(*job)
+    except Exception as e:
+        return e
+    return None
+
+
+def create_structure(paths, base_dir=None, jobs=None):
     """
     Create directories and files based on parsed paths.
+    Files are written by a thread pool of `jobs` workers when there are
+    enough of them to benefit; jobs=1 forces serial creation. If a path is
+    used both as a file and as a directory, every entry is instead created
+    one at a time in structure-file order.
     """
     if base_dir is None:
         base_dir = Path.cwd()
     else:
         base_dir = Path(base_dir)
+    base = os.fspath(base_dir)
 
     created = {'dirs': [], 'files': []}
+    messages = []
+    readme = f'# {base_dir.name}\n\nProject generated from structure file.\n'.encode('utf-8')
+
+    ensured = set()
+    conflicts = _file_dir_conflicts(paths)
+
+    # Create each distinct directory chain once up front, unless names clash
+    leaves = [] if conflicts else _leaf_dirs(paths)
+    for leaf in leaves:
+        leaf_path = os.path.join(base, leaf)
+        try:
+            os.makedirs(leaf_path, exist_ok=True)
+        except Exception:
+            # Reported below against the entries that needed it
+            continue
+        ensured.add(base)
+        ensured.add(leaf_path)
+        ensured.update(os.path.join(base, parent) for parent in _parent_dirs(leaf))
+
+    # Work out what each file needs
+    file_jobs = []
+    for path, item_type in paths:
+        if item_type == 'file':
+            full_path = os.path.join(base, path)
+
+            # Add appropriate content for known file types
+            name = os.path.basename(full_path)
+            if name == 'README.md':
+                payload = readme
+            else:
+                payload = _DEFAULT_CONTENT.get(name)
+
+            file_jobs.append((full_path, payload, ensured))
+
+    if jobs is None:
+        jobs = min(32, (os.cpu_count() or 1) * 4)
+    if conflicts:
+        # Create each file lazily as the loop below reaches it
+        file_errors = (_try_create_file(job) for job in file_jobs)
+    elif jobs > 1 and len(file_jobs) >= _PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            file_errors = iter(list(executor.map(_try_create_file, file_jobs)))
+    else:
+        file_errors = iter([_try_create_file(job) for job in file_jobs])
 
+    # Create remaining directories and report results in structure-file order
     for path, item_type in paths:
-        full_path = base_dir / path
+        full_path = os.path.join(base, path)
 
         if item_type == 'dir':
             try:
-                full_path.mkdir(parents=True, exist_ok=True)
-                created['dirs'].append(str(full_path))
-                print(f"✅ Created directory: {path}")
+                if full_path not in ensured:
+                    os.makedirs(full_path, exist_ok=True)
+                    ensured.add(full_path)
+                created['dirs'].append(full_path)
+                messages.append(f"✅ Created directory: {path}\n")
             except Exception as e:
-                print(f"❌ Failed to create directory {path}: {e}")
+                messages.append(f"❌ Failed to create directory {path}: {e}\n")
 
         elif item_type == 'file':
-            try:
-                # Create parent directories if they don't exist
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Create empty file if it doesn't exist
-                if not full_path.exists():
-                    full_path.touch()
-
-                    # Add appropriate content for known file types
-                    if full_path.name == '__init__.py':
-                        with open(full_path, 'w') as f:
-                            f.write('"""Package initialization."""\n')
-
-                    elif full_path.name == 'settings.json':
-                        default_settings = {
-                            "timer_intervals": {
-                                "focus": 30,
-                                "short_break": 5,
-                                "long_break": 15
-                            },
-                            "growth_stages": {
-                                "seed": {"minutes": 0, "image": "seed.png"},
-                                "sprout": {"minutes": 30, "image": "sprout.png"},
-                                "plant": {"minutes": 60, "image": "plant.png"},
-                                "flower": {"minutes": 90, "image": "flower.png"}
-                            }
-                        }
-                        with open(full_path, 'w') as f:
-                            json.dump(default_settings, f, indent=4)
-
-                    elif full_path.name == 'requirements.txt':
-                        with open(full_path, 'w') as f:
-                            f.write('# Dependencies\nPillow>=9.0.0\n')
-
-                    elif full_path.name == 'README.md':
-                        with open(full_path, 'w') as f:
-                            f.write(f'# {base_dir.name}\n\nProject generated from structure file.\n')
-
-                    elif full_path.name == '.gitignore':
-                        with open(full_path, 'w') as f:
-                            f.write(
-                                '# Python\n__pycache__/\n*.py[cod]\n*.so\n.Python\n\n# Environment\n.env\n.venv\nenv/\nvenv/\n\n# IDE\n.vscode/\n.idea/\n*.swp\n*.swo\n*~\n\n# OS\n.DS_Store\nThumbs.db\n')
-
-                created['files'].append(str(full_path))
-                print(f"✅ Created file: {path}")
+            error = next(file_errors)
+            if error is None:
+                created['files'].append(full_path)
+                messages.append(f"✅ Created file: {path}\n")
+            else:
+                messages.append(f"❌ Failed to create file {path}: {error}\n")
 
-            except Exception as e:
-                print(f"❌ Failed to create file {path}: {e}")
+    # Report everything in one write rather than a print per entry
+    sys.stdout.write(''.join(messages))
 
     return created
 
@@ -154,6 +297,7 @@ Examples:
   structure my-structure.txt     # Use specific file
   structure -o myproject         # Output to myproject directory
   structure --dry-run            # Preview without creating
+  structure -j 8                 # Create files using 8 threads
   structure --init                # Create a template structure.txt file
         """
     )
@@ -177,6 +321,13 @@ Examples:
         help='Show what would be created without actually creating anything'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Number of threads used to create files (default: based on CPU count, 1 for serial)'
+    )
+
     parser.add_argument(
         '--init',
         action='store_true',
@@ -241,7 +392,7 @@ Examples:
 
     # Create the structure
     print(f"\n🚀 Creating project structure...")
-    created = create_structure(paths, args.output)
+    created = create_structure(paths, args.output, args.jobs)
 
     # Summary
     print(f"\n📊 Summary:")